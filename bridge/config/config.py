@@ -1,10 +1,10 @@
 """Configuration handler."""
 
 import os
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 import yaml
-from pydantic import BaseModel, StrictInt, model_validator, validator
+from pydantic import BaseModel, PrivateAttr, StrictInt, model_validator, validator
 
 _instances: Dict[str, "Config"] = {}
 _file_path = os.path.join(
@@ -28,6 +28,37 @@ class ForwarderConfig(BaseModel):
     excluded_hashtags: Optional[List[dict]] = None
     mention_override: Optional[List[dict]] = None
 
+    _forward_hashtag_index: Dict[str, dict] = PrivateAttr(default_factory=dict)
+    _excluded_hashtag_index: Dict[str, dict] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context) -> None:
+        """Index the forward and excluded hashtags by their lowercased name."""
+        self._forward_hashtag_index = {
+            tag["name"].lower(): tag for tag in self.forward_hashtags or []
+        }
+        self._excluded_hashtag_index = {
+            tag["name"].lower(): tag for tag in self.excluded_hashtags or []
+        }
+
+    @property
+    def forward_hashtag_index(self) -> Dict[str, dict]:
+        """Forward hashtags keyed by their lowercased name."""
+        return self._forward_hashtag_index
+
+    @property
+    def excluded_hashtag_index(self) -> Dict[str, dict]:
+        """Excluded hashtags keyed by their lowercased name."""
+        return self._excluded_hashtag_index
+
+    @property
+    def forwards_unconditionally(self) -> bool:
+        """Whether every message is forwarded without looking at its hashtags."""
+        return (
+            self.forward_everything
+            and not self.mention_override
+            and not self.excluded_hashtags
+        )
+
     def __getitem__(self, item):
         return getattr(self, item)
 
@@ -191,6 +222,17 @@ class DiscordConfig(BaseModel):  # pylint: disable=too-few-public-methods
     max_latency: float = 0.5
     is_healthy: bool = False
 
+    _built_in_role_names: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+
+    def model_post_init(self, __context) -> None:
+        """Index the built-in roles by their configured name."""
+        self._built_in_role_names = frozenset(self.built_in_roles)
+
+    @property
+    def built_in_role_names(self) -> FrozenSet[str]:
+        """Names of the built-in roles, as configured."""
+        return self._built_in_role_names
+
     @model_validator(mode="before")
     def discord_validator(cls, values):
         """Discord validator."""
@@ -387,6 +429,20 @@ class ConfigSummary(BaseModel):  # pylint: disable=too-few-public-methods
     api: APIConfig
 
 
+def _validate_forwarder_combinations(values):
+    """Reject the forwarders sharing the same Telegram and Discord channels."""
+    forwarder_combinations = set()
+    for forwarder in values.get("telegram_forwarders") or []:
+        tg_channel_id = forwarder["tg_channel_id"]
+        discord_channel_id = forwarder["discord_channel_id"]
+        combination = (tg_channel_id, discord_channel_id)
+        if combination in forwarder_combinations:
+            raise ValueError(f"Forwarder combination {combination} is duplicated")
+
+        forwarder_combinations.add(combination)
+    return values
+
+
 class ConfigYAMLSchema(BaseModel):  # pylint: disable=too-few-public-methods
     """Config YAML schema."""
 
@@ -401,16 +457,7 @@ class ConfigYAMLSchema(BaseModel):  # pylint: disable=too-few-public-methods
     @model_validator(mode="before")
     def forwarder_validator(cls, values):
         """Validate forwarder combinations to avoid duplicates."""
-        forwarder_combinations = set()
-        for forwarder in values.get("telegram_forwarders"):
-            tg_channel_id = forwarder["tg_channel_id"]
-            discord_channel_id = forwarder["discord_channel_id"]
-            combination = (tg_channel_id, discord_channel_id)
-            if combination in forwarder_combinations:
-                raise ValueError(f"Forwarder combination {combination} is duplicated")
-
-            forwarder_combinations.add(combination)
-        return values
+        return _validate_forwarder_combinations(values)
 
     @model_validator(mode="after")
     def shared_forward_hashtags_validator(cls, values):
@@ -460,6 +507,11 @@ class Config(BaseModel):
     openai: OpenAIConfig
     telegram_forwarders: List[ForwarderConfig]
 
+    @model_validator(mode="before")
+    def forwarder_validator(cls, values):
+        """Validate forwarder combinations to avoid sending a message twice to the same Discord channel."""
+        return _validate_forwarder_combinations(values)
+
     def __getitem__(self, item):
         try:
             return getattr(self, item)
@@ -3,7 +3,8 @@
 import asyncio
 import os
 import sys
-from typing import List
+import time
+from typing import Dict, List, Set, Tuple
 
 import discord
 from discord import Message as DiscordMessage
@@ -27,8 +28,18 @@ from bridge.utils import telegram_entities_to_markdown
 config = Config.get_instance()
 logger = Logger.get_logger(config.application.name)
 
+# Maximum number of concurrent sends to a single Discord channel
+DISCORD_CHANNEL_CONCURRENCY = 5
 
-class Bridge:
+# Maximum number of recovered messages waiting to be forwarded
+RECOVERY_QUEUE_SIZE = 256
+# Number of tasks forwarding the recovered messages
+RECOVERY_CONSUMERS = 4
+# Seconds during which a new message is left to the live handler
+RECOVERY_GRACE_PERIOD = 30
+
+
+class Bridge:  # pylint: disable=too-many-instance-attributes
     """Bridge between Telegram and Discord."""
 
     def __init__(self, telegram_client: TelegramClient, discord_client: discord.Client):
@@ -36,14 +47,30 @@ class Bridge:
         self.discord_client = discord_client
         self.discord_handler = DiscordHandler()
         self.history_manager = MessageHistoryHandler()
-        self.input_channels_entities = []
+        self.input_channels_entities: Tuple[InputChannel, ...] = ()
+        self._forwarders_by_channel: Dict[int, List[ForwarderConfig]] = {}
+        self._discord_channel_semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._role_mention_cache: Dict[int, Dict[str, str]] = {}
+        # (tg_channel_id, tg_message_id) of the new messages being forwarded
+        self._messages_in_flight: Set[Tuple[int, int]] = set()
+        self._build_forwarders_index()
 
         logger.debug("Forwarders: %s", config.telegram_forwarders)
 
+    def _build_forwarders_index(self):
+        """Index the configured forwarders by their Telegram channel ID."""
+        forwarders_by_channel: Dict[int, List[ForwarderConfig]] = {}
+        for forwarder in config.telegram_forwarders:
+            forwarders_by_channel.setdefault(
+                int(forwarder["tg_channel_id"]), []
+            ).append(forwarder)
+        self._forwarders_by_channel = forwarders_by_channel
+
     async def start(self):
         """Start the bridge."""
         await self._register_forwarders()
         await self._register_telegram_handlers()
+        self._register_discord_handlers()
 
         # @self.telegram_client.on(events.NewMessage(chats=self.input_channels_entities))
         # async def handler(self, event):
@@ -58,14 +85,18 @@ class Bridge:
     async def _register_forwarders(self):
         """Register the forwarders."""
         logger.info("Registering forwarders...")
+        self._build_forwarders_index()
 
-        if not self.telegram_client.is_connected():
-            logger.warning("Telegram client not connected, retrying...")
-            await asyncio.sleep(1)
-            await self._register_forwarders()
-            return
+        backoff = 0.5
+        while not self.telegram_client.is_connected():
+            logger.warning(
+                "Telegram client not connected, retrying in %s seconds...", backoff
+            )
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 10)
 
         logger.debug("Iterating dialogs...")
+        input_channels_entities: List[InputChannel] = []
         try:
             async for dialog in self.telegram_client.iter_dialogs():
                 if not isinstance(dialog.entity, Channel) and not isinstance(
@@ -80,20 +111,32 @@ class Bridge:
                         )
                     continue
 
-                for forwarder in config.telegram_forwarders:
-                    # type: ignore
-                    if forwarder.tg_channel_id in {dialog.name, dialog.entity.id}:
-                        self.input_channels_entities.append(
-                            InputChannel(dialog.entity.id, dialog.entity.access_hash)
-                        )  # type: ignore
+                matching_forwarders = self.get_matching_forwarders(dialog.entity.id)
+                if not matching_forwarders:
+                    continue
 
-                        logger.info(
-                            "Registered Forwarder %s: Telegram channel '%s' (ID %s) with Discord Channel %s",
-                            forwarder.forwarder_name,
-                            dialog.name,
-                            dialog.entity.id,
-                            forwarder.discord_channel_id,
-                        )  # type: ignore
+                input_channels_entities.append(
+                    InputChannel(dialog.entity.id, dialog.entity.access_hash)
+                )  # type: ignore
+
+                for forwarder in matching_forwarders:
+                    logger.info(
+                        "Registered Forwarder %s: Telegram channel '%s' (ID %s) with Discord Channel %s",
+                        forwarder.forwarder_name,
+                        dialog.name,
+                        dialog.entity.id,
+                        forwarder.discord_channel_id,
+                    )  # type: ignore
+
+                # stop iterating once every configured channel is registered
+                if (
+                    len(input_channels_entities) == len(self._forwarders_by_channel)
+                    and not config.telegram.log_unhandled_dialogs
+                ):
+                    break
+
+            # the registered channels don't change anymore, share them as a tuple
+            self.input_channels_entities = tuple(input_channels_entities)
 
             if len(self.input_channels_entities) <= 0:
                 logger.error("No channel matching found, exiting...")
@@ -125,10 +168,37 @@ class Bridge:
             )
             logger.info("Subscribed to Telegram delete events")
 
+    def _register_discord_handlers(self):
+        """Register the Discord handlers."""
+        logger.info("Registering Discord handlers...")
+        # discord.Client has no add_listener, it dispatches to its on_<event> attributes
+        self.discord_client.on_guild_role_create = self._handle_guild_role_change
+        self.discord_client.on_guild_role_delete = self._handle_guild_role_change
+        self.discord_client.on_guild_role_update = self._handle_guild_role_update
+
+    async def _handle_guild_role_change(self, role: discord.Role):
+        """Invalidate the cached role mentions of the role's guild."""
+        logger.debug("Discord roles changed for guild %s", role.guild.id)
+        self._role_mention_cache.pop(role.guild.id, None)
+
+    async def _handle_guild_role_update(self, _: discord.Role, after: discord.Role):
+        """Invalidate the cached role mentions when a role is updated."""
+        await self._handle_guild_role_change(after)
+
+    def _get_role_mentions(self, guild: discord.Guild) -> Dict[str, str]:
+        """Get the guild's role mentions keyed by lowercased role name."""
+        role_mentions = self._role_mention_cache.get(guild.id)
+        if role_mentions is None:
+            role_mentions = {}
+            for role in guild.roles:
+                role_mentions.setdefault(role.name.lower(), role.mention)
+            self._role_mention_cache[guild.id] = role_mentions
+        return role_mentions
+
     async def _handle_new_message(
-        self, event
-    ):  # pylint: disable=too-many-branches,too-many-statements,too-many-locals
-        """Handle the processing of a new Telegram message."""
+        self, event, forwarders: List[ForwarderConfig] | None = None
+    ):
+        """Handle the processing of a new Telegram message, through the given forwarders or all those of its channel."""
         logger.debug("processing Telegram message: %s", event)
 
         if not isinstance(event.message, Message):
@@ -142,6 +212,21 @@ class Bridge:
 
         tg_channel_id = message.peer_id.channel_id  # type: ignore
 
+        in_flight_key = (tg_channel_id, message.id)
+        self._messages_in_flight.add(in_flight_key)
+        try:
+            await self._forward_new_message(event, message, tg_channel_id, forwarders)
+        finally:
+            self._messages_in_flight.discard(in_flight_key)
+
+    async def _forward_new_message(
+        self,
+        event,
+        message: Message,
+        tg_channel_id: int,
+        forwarders: List[ForwarderConfig] | None,
+    ):
+        """Forward a new Telegram message through its matching forwarders."""
         if config.application.anti_spam_enabled:
             # check for duplicate messages
             if await self.history_manager.spam_filter(
@@ -152,8 +237,10 @@ class Bridge:
                 logger.debug("Duplicate message found, skipping...")
                 return
 
-        matching_forwarders: List[ForwarderConfig] = self.get_matching_forwarders(
-            tg_channel_id
+        matching_forwarders: List[ForwarderConfig] = (
+            forwarders
+            if forwarders is not None
+            else self.get_matching_forwarders(tg_channel_id)
         )
 
         if len(matching_forwarders) < 1:
@@ -163,84 +250,107 @@ class Bridge:
         logger.debug("Found %s matching forwarders", len(matching_forwarders))
         logger.debug("Matching forwarders: %s", matching_forwarders)
 
-        for forwarder in matching_forwarders:
-            logger.debug("Forwarder config: %s", forwarder)
-
-            should_forward_message = forwarder.forward_everything
-            mention_everyone = forwarder.mention_everyone
-            message_forward_hashtags: List[str] = []
-
-            if not should_forward_message or forwarder.mention_override:
-                message_forward_hashtags = self.get_message_forward_hashtags(message)
-
-                logger.debug("message_forward_hashtags: %s", message_forward_hashtags)
-
-                logger.debug("mention_override: %s", forwarder.mention_override)
-
-                logger.debug("forward_hashtags: %s", forwarder.forward_hashtags)
-
-                matching_forward_hashtags = []
+        message_forward_hashtags: List[str] = []
+        if not all(
+            forwarder.forwards_unconditionally for forwarder in matching_forwarders
+        ):
+            message_forward_hashtags = self.get_message_forward_hashtags(message)
+            logger.debug("message_forward_hashtags: %s", message_forward_hashtags)
+
+        message_forward_hashtags_lc = {tag.lower() for tag in message_forward_hashtags}
+
+        results = await asyncio.gather(
+            *(
+                self._dispatch_to_forwarder(
+                    event,
+                    forwarder,
+                    tg_channel_id,
+                    message_forward_hashtags,
+                    message_forward_hashtags_lc,
+                )
+                for forwarder in matching_forwarders
+            ),
+            return_exceptions=True,
+        )
 
-                if message_forward_hashtags and forwarder.forward_hashtags:
-                    matching_forward_hashtags = [
-                        tag
-                        for tag in forwarder.forward_hashtags
-                        if tag["name"].lower() in message_forward_hashtags
-                    ]
+        mappings = []
+        for forwarder, result in zip(matching_forwarders, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Forwarder %s failed to forward TG message %s: %s",
+                    forwarder.forwarder_name,
+                    message.id,
+                    result,
+                    exc_info=config.application.debug,
+                )
+            elif result:
+                mappings.append(result)
+
+        if mappings:
+            logger.debug("Saving mapping data for TG message %s", message.id)
+            await self.history_manager.save_mappings_data(mappings)
+
+    async def _dispatch_to_forwarder(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        event,
+        forwarder: ForwarderConfig,
+        tg_channel_id: int,
+        message_forward_hashtags: List[str],
+        message_forward_hashtags_lc: Set[str],
+    ) -> Tuple[str, int, int] | None:
+        """Forward a new Telegram message through a single forwarder."""
+        message: Message = event.message
 
-                if len(matching_forward_hashtags) > 0:
-                    should_forward_message = True
-                    mention_everyone = any(
-                        tag.get("override_mention_everyone", False)
-                        for tag in matching_forward_hashtags
-                    )
+        logger.debug(
+            "Forwarder config for Telegram channel %s: %s", tg_channel_id, forwarder
+        )
 
-            if forwarder.excluded_hashtags:
-                message_forward_hashtags = self.get_message_forward_hashtags(message)
+        should_forward_message = forwarder.forward_everything
+        mention_everyone = forwarder.mention_everyone
 
-                matching_forward_hashtags = [
-                    tag
-                    for tag in forwarder.excluded_hashtags
-                    if tag["name"].lower() in message_forward_hashtags
-                ]
+        if not forwarder.forwards_unconditionally:
+            should_forward_message, mention_everyone = self._match_forwarder_hashtags(
+                forwarder, message_forward_hashtags_lc
+            )
 
-                if len(matching_forward_hashtags) > 0:
-                    should_forward_message = False
+        if not should_forward_message:
+            return None
 
-            if not should_forward_message:
-                continue
+        discord_channel = self.discord_client.get_channel(
+            forwarder.discord_channel_id
+        )  # type: ignore
 
-            discord_channel = self.discord_client.get_channel(
-                forwarder.discord_channel_id
-            )  # type: ignore
-            server_roles = discord_channel.guild.roles  # type: ignore
+        mention_roles: List[str] = []
+        if forwarder.mention_override:
+            role_mentions = self._get_role_mentions(discord_channel.guild)  # type: ignore
 
             mention_roles = self.discord_handler.get_mention_roles(
                 message_forward_hashtags,
                 forwarder.mention_override,
-                config.discord.built_in_roles,
-                server_roles,
+                config.discord.built_in_role_names,
+                role_mentions,
             )
 
-            message_text = await self.process_message_text(
-                message,
-                forwarder.strip_off_links,
-                mention_everyone,
-                mention_roles,
-                config.openai.enabled,
-            )
+        message_text = await self.process_message_text(
+            message,
+            forwarder.strip_off_links,
+            mention_everyone,
+            mention_roles,
+            config.openai.enabled,
+        )
 
-            if message.reply_to and message.reply_to.reply_to_msg_id:
-                discord_reference = (
-                    await self.discord_handler.fetch_reference(
-                        message, forwarder.forwarder_name, discord_channel
-                    )
-                    if message.reply_to.reply_to_msg_id
-                    else None
+        if message.reply_to and message.reply_to.reply_to_msg_id:
+            discord_reference = (
+                await self.discord_handler.fetch_reference(
+                    message, forwarder.forwarder_name, discord_channel
                 )
-            else:
-                discord_reference = None
+                if message.reply_to.reply_to_msg_id
+                else None
+            )
+        else:
+            discord_reference = None
 
+        async with self._get_discord_channel_semaphore(forwarder.discord_channel_id):
             if message.media:
                 sent_discord_messages = await self.handle_message_media(
                     message, discord_channel, message_text, discord_reference
@@ -252,38 +362,79 @@ class Bridge:
                     reference=discord_reference,
                 )  # type: ignore
 
-            if sent_discord_messages:
-                logger.debug(
-                    "Forwarded TG message %s to Discord channel %s",
-                    sent_discord_messages[0].id,
-                    forwarder.discord_channel_id,
-                )
+        if sent_discord_messages:
+            logger.debug(
+                "Forwarded TG message %s to Discord channel %s",
+                sent_discord_messages[0].id,
+                forwarder.discord_channel_id,
+            )
 
-                logger.debug(
-                    "Saving mapping data for forwarder %s", forwarder.forwarder_name
-                )
-                main_sent_discord_message = sent_discord_messages[0]
-                await self.history_manager.save_mapping_data(
-                    forwarder.forwarder_name, message.id, main_sent_discord_message.id
-                )
-                logger.info(
-                    "Forwarded TG message %s to Discord message %s",
-                    message.id,
-                    main_sent_discord_message.id,
-                )
-            else:
-                await self.history_manager.save_missed_message(
-                    forwarder.forwarder_name,
-                    message.id,
-                    forwarder.discord_channel_id,
-                    None,
-                )
-                logger.error(
-                    "Failed to forward TG message %s to Discord",
-                    message.id,
-                    exc_info=config.application.debug,
+            main_sent_discord_message = sent_discord_messages[0]
+            logger.info(
+                "Forwarded TG message %s to Discord message %s",
+                message.id,
+                main_sent_discord_message.id,
+            )
+            return forwarder.forwarder_name, message.id, main_sent_discord_message.id
+
+        await self.history_manager.save_missed_message(
+            forwarder.forwarder_name,
+            message.id,
+            forwarder.discord_channel_id,
+            None,
+        )
+        logger.error(
+            "Failed to forward TG message %s to Discord",
+            message.id,
+            exc_info=config.application.debug,
+        )
+        return None
+
+    @staticmethod
+    def _match_forwarder_hashtags(
+        forwarder: ForwarderConfig, message_forward_hashtags_lc: Set[str]
+    ) -> Tuple[bool, bool]:
+        """Decide from the message hashtags whether to forward and mention everyone."""
+        should_forward_message = forwarder.forward_everything
+        mention_everyone = forwarder.mention_everyone
+
+        if not should_forward_message or forwarder.mention_override:
+            logger.debug("mention_override: %s", forwarder.mention_override)
+            logger.debug("forward_hashtags: %s", forwarder.forward_hashtags)
+
+            matching_forward_hashtags = []
+
+            if message_forward_hashtags_lc and forwarder.forward_hashtag_index:
+                matching_forward_hashtags = [
+                    forwarder.forward_hashtag_index[tag]
+                    for tag in message_forward_hashtags_lc
+                    if tag in forwarder.forward_hashtag_index
+                ]
+
+            if len(matching_forward_hashtags) > 0:
+                should_forward_message = True
+                mention_everyone = any(
+                    tag.get("override_mention_everyone", False)
+                    for tag in matching_forward_hashtags
                 )
 
+        if not forwarder.excluded_hashtag_index.keys().isdisjoint(
+            message_forward_hashtags_lc
+        ):
+            should_forward_message = False
+
+        return should_forward_message, mention_everyone
+
+    def _get_discord_channel_semaphore(
+        self, discord_channel_id: int
+    ) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent sends to a Discord channel."""
+        semaphore = self._discord_channel_semaphores.get(discord_channel_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(DISCORD_CHANNEL_CONCURRENCY)
+            self._discord_channel_semaphores[discord_channel_id] = semaphore
+        return semaphore
+
     async def _handle_edit_message(self, event):
         """Handle the processing of a Telegram edited message."""
         logger.debug("processing Telegram edited message event: %s", event)
@@ -337,17 +488,9 @@ class Bridge:
 
             try:
                 # type: ignore
-                discord_message = await discord_channel.fetch_message(
-                    discord_message_id
+                await discord_channel.get_partial_message(discord_message_id).edit(
+                    content=tg_message_text
                 )
-
-                if discord_message is None:
-                    logger.error("Discord message not found, skipping...")
-                    continue
-
-                logger.debug("Discord message: %s", discord_message)
-
-                await discord_message.edit(content=tg_message_text)
             except discord.NotFound:
                 logger.error("Discord message not found, skipping...")
                 return
@@ -382,72 +525,74 @@ class Bridge:
         for forwarder in matching_forwarders:
             logger.debug("Forwarder config: %s", forwarder)
 
-            for deleted_id in event.deleted_ids:
-                discord_message_id = await self.history_manager.get_discord_message_id(
-                    forwarder.forwarder_name, deleted_id
-                )
+            discord_message_ids = await self.history_manager.get_discord_message_ids(
+                forwarder.forwarder_name, event.deleted_ids
+            )
 
-                if discord_message_id is None:
+            for deleted_id in event.deleted_ids:
+                if deleted_id not in discord_message_ids:
                     logger.debug(
                         "No Discord message found for Telegram message %s", deleted_id
                     )
-                    continue
 
-                logger.debug("Discord message ID: %s", discord_message_id)
+            if not discord_message_ids:
+                continue
 
-                discord_channel = self.discord_client.get_channel(
-                    forwarder.discord_channel_id
-                )
+            discord_channel = self.discord_client.get_channel(
+                forwarder.discord_channel_id
+            )
 
-                if discord_channel is None:
-                    logger.error(
-                        "Discord channel %s not found", forwarder.discord_channel_id
-                    )
-                    return
+            if discord_channel is None:
+                logger.error(
+                    "Discord channel %s not found", forwarder.discord_channel_id
+                )
+                continue
 
-                try:
-                    # type: ignore
-                    discord_message = await discord_channel.fetch_message(
-                        discord_message_id
+            await asyncio.gather(
+                *(
+                    self._delete_discord_message(
+                        discord_channel, discord_message_id, forwarder
                     )
-                except discord.errors.NotFound:
-                    logger.debug("Discord message %s not found", discord_message_id)
-                    return
+                    for discord_message_id in discord_message_ids.values()
+                )
+            )
 
-                logger.debug("Discord message: %s", discord_message)
+    async def _delete_discord_message(
+        self, discord_channel, discord_message_id: int, forwarder: ForwarderConfig
+    ):
+        """Delete a forwarded message from a Discord channel."""
+        logger.debug("Discord message ID: %s", discord_message_id)
 
-                try:
-                    await discord_message.delete()
-                except discord.errors.NotFound:
-                    logger.debug(
-                        "Discord message %s not found",
-                        discord_message_id,
-                        exc_info=config.application.debug,
-                    )
-                    return
-                except discord.errors.Forbidden:
-                    logger.error(
-                        "Discord forbade deleting message %s",
-                        discord_message_id,
-                        exc_info=config.application.debug,
-                    )
-                    return
-                except discord.errors.HTTPException as ex:
-                    logger.error(
-                        "Failed deleting message %s: %s",
-                        discord_message_id,
-                        ex,
-                        exc_info=config.application.debug,
-                    )
-                    return
+        async with self._get_discord_channel_semaphore(forwarder.discord_channel_id):
+            try:
+                # type: ignore
+                await discord_channel.get_partial_message(discord_message_id).delete()
+                self.discord_handler.forget_reference(
+                    discord_channel.id, discord_message_id
+                )
+            except discord.errors.NotFound:
+                logger.debug(
+                    "Discord message %s not found",
+                    discord_message_id,
+                    exc_info=config.application.debug,
+                )
+            except discord.errors.Forbidden:
+                logger.error(
+                    "Discord forbade deleting message %s",
+                    discord_message_id,
+                    exc_info=config.application.debug,
+                )
+            except discord.errors.HTTPException as ex:
+                logger.error(
+                    "Failed deleting message %s: %s",
+                    discord_message_id,
+                    ex,
+                    exc_info=config.application.debug,
+                )
 
     def get_matching_forwarders(self, tg_channel_id: int) -> List[ForwarderConfig]:
         """Get the forwarders that match the given Telegram channel ID."""
-        return [
-            forwarder_config
-            for forwarder_config in config.telegram_forwarders
-            if tg_channel_id == forwarder_config["tg_channel_id"]
-        ]  # pylint: disable=line-too-long
+        return self._forwarders_by_channel.get(tg_channel_id, [])
 
     @staticmethod
     def get_message_forward_hashtags(message: Message):
@@ -480,7 +625,7 @@ class Bridge:
             message_text = message.message
 
         if openai_enabled:
-            suggestions = await OpenAIHandler.analyze_message_sentiment(message.message)
+            suggestions = await OpenAIHandler.get_message_sentiment(message.message)
             message_text = f"{message_text}\n{suggestions}"
 
         if mention_everyone:
@@ -562,61 +707,199 @@ class Bridge:
                     "Internet connection active and Telegram is connected, checking for missed messages"
                 )
                 try:
-                    last_messages = (
-                        await self.history_manager.get_last_messages_for_all_forwarders()
+                    await self._recover_missed_messages()
+                except Exception as exception:  # pylint: disable=broad-except
+                    logger.error(
+                        "Failed to fetch missed messages: %s",
+                        exception,
+                        exc_info=config.application.debug,
                     )
 
-                    logger.debug("Last forwarded messages: %s", last_messages)
+            logger.debug(
+                "on_restored_connectivity will trigger again in for %s seconds",
+                config.application.healthcheck_interval,
+            )
+            await asyncio.sleep(config.application.healthcheck_interval)
 
-                    for last_message in last_messages:
-                        forwarder_name = last_message["forwarder_name"]
-                        last_tg_message_id = last_message["telegram_id"]
+    async def _recover_missed_messages(self):
+        """Replay the Telegram messages sent after the last forwarded ones."""
+        last_messages = (
+            await self.history_manager.get_last_messages_for_all_forwarders()
+        )
 
-                        channel_id = config.get_telegram_channel_by_forwarder_name(
-                            forwarder_name
-                        )
+        logger.debug("Last forwarded messages: %s", last_messages)
+
+        last_tg_message_ids: Dict[str, int] = {
+            last_message["forwarder_name"]: last_message["telegram_id"]
+            for last_message in last_messages
+        }
+
+        # each forwarder is recovered from its own last forwarded message
+        recovering_forwarders: Dict[int, List[Tuple[ForwarderConfig, int]]] = {}
+        for channel_id, forwarders in self._forwarders_by_channel.items():
+            channel_forwarders = [
+                (forwarder, last_tg_message_ids[forwarder.forwarder_name])
+                for forwarder in forwarders
+                if forwarder.forwarder_name in last_tg_message_ids
+            ]
+            if channel_forwarders:
+                recovering_forwarders[channel_id] = channel_forwarders
+
+        if not recovering_forwarders:
+            return
 
-                        if channel_id:
-                            fetched_messages = (
-                                await self.history_manager.fetch_messages_after(
-                                    last_tg_message_id, channel_id, self.telegram_client
-                                )
-                            )
-                            for fetched_message in fetched_messages:
-                                logger.debug(
-                                    "Recovered message %s from channel %s",
-                                    fetched_message.id,
-                                    channel_id,
-                                )
-                                event = events.NewMessage.Event(message=fetched_message)
-                                event.peer = await self.telegram_client.get_input_entity(  # type: ignore
-                                    channel_id
-                                )
-
-                                if config.discord.is_healthy is False:
-                                    logger.warning(
-                                        "Discord is not available despite the connectivty is restored, queing TG message %s",
-                                        event.message.id,
-                                    )
-                                    # await add_to_queue(event)
-                                    continue
-                                # delay the message delivery to avoid rate limit and flood
-                                await asyncio.sleep(config.application.recoverer_delay)
-                                logger.debug(
-                                    "Forwarding recovered Telegram message %s",
-                                    event.message.id,
-                                )
-                                await self._handle_new_message(event)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=RECOVERY_QUEUE_SIZE)
+        channel_locks = {
+            channel_id: asyncio.Lock() for channel_id in recovering_forwarders
+        }
+        consumers = [
+            asyncio.create_task(self._consume_missed_messages(queue, channel_locks))
+            for _ in range(RECOVERY_CONSUMERS)
+        ]
 
-                except Exception as exception:  # pylint: disable=broad-except
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._produce_missed_messages(queue, channel_id, channel_forwarders)
+                    for channel_id, channel_forwarders in recovering_forwarders.items()
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
                     logger.error(
                         "Failed to fetch missed messages: %s",
-                        exception,
+                        result,
                         exc_info=config.application.debug,
                     )
 
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+
+    async def _produce_missed_messages(
+        self,
+        queue: asyncio.Queue,
+        channel_id: int,
+        channel_forwarders: List[Tuple[ForwarderConfig, int]],
+    ):
+        """Fetch the messages missed in a Telegram channel and queue them with the forwarders that missed them."""
+        fetched_messages = await self.history_manager.fetch_messages_after(
+            min(last_tg_message_id for _, last_tg_message_id in channel_forwarders),
+            channel_id,
+            self.telegram_client,
+        )
+        if not fetched_messages:
+            return
+
+        peer = await self.telegram_client.get_input_entity(channel_id)
+
+        for fetched_message in fetched_messages:
+            forwarders = self._get_forwarding_forwarders(
+                fetched_message,
+                [
+                    forwarder
+                    for forwarder, last_tg_message_id in channel_forwarders
+                    if last_tg_message_id < fetched_message.id
+                ],
+            )
+            if not forwarders:
+                continue
+
             logger.debug(
-                "on_restored_connectivity will trigger again in for %s seconds",
-                config.application.healthcheck_interval,
+                "Recovered message %s from channel %s",
+                fetched_message.id,
+                channel_id,
             )
-            await asyncio.sleep(config.application.healthcheck_interval)
+            event = events.NewMessage.Event(message=fetched_message)
+            event.peer = peer  # type: ignore
+            await queue.put((channel_id, event, forwarders))
+
+    def _get_forwarding_forwarders(
+        self, message: Message, forwarders: List[ForwarderConfig]
+    ) -> List[ForwarderConfig]:
+        """Keep the forwarders that would forward the message according to its hashtags."""
+        if all(forwarder.forwards_unconditionally for forwarder in forwarders):
+            return forwarders
+
+        message_forward_hashtags_lc = {
+            tag.lower() for tag in self.get_message_forward_hashtags(message)
+        }
+        return [
+            forwarder
+            for forwarder in forwarders
+            if forwarder.forwards_unconditionally
+            or self._match_forwarder_hashtags(forwarder, message_forward_hashtags_lc)[0]
+        ]
+
+    async def _consume_missed_messages(
+        self, queue: asyncio.Queue, channel_locks: Dict[int, asyncio.Lock]
+    ):
+        """Forward the queued missed messages until a `None` sentinel is received."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            channel_id, event, forwarders = item
+
+            if self._is_message_pending(channel_id, event.message):
+                logger.debug(
+                    "TG message %s is left to the live handler, skipping...",
+                    event.message.id,
+                )
+                continue
+
+            if config.discord.is_healthy is False:
+                logger.warning(
+                    "Discord is not available despite the connectivty is restored, queing TG message %s",
+                    event.message.id,
+                )
+                # await add_to_queue(event)
+                continue
+
+            # the lock keeps the messages of a channel in their original order
+            async with channel_locks[channel_id]:
+                # delay the message delivery to avoid rate limit and flood
+                await asyncio.sleep(config.application.recoverer_delay)
+                if self._is_message_pending(channel_id, event.message):
+                    continue
+                logger.debug(
+                    "Forwarding recovered Telegram message %s",
+                    event.message.id,
+                )
+                try:
+                    forwarders = await self._get_unmapped_forwarders(
+                        forwarders, event.message.id
+                    )
+                    if forwarders:
+                        await self._handle_new_message(event, forwarders)
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.error(
+                        "Failed to forward recovered Telegram message %s: %s",
+                        event.message.id,
+                        ex,
+                        exc_info=config.application.debug,
+                    )
+
+    async def _get_unmapped_forwarders(
+        self, forwarders: List[ForwarderConfig], tg_message_id: int
+    ) -> List[ForwarderConfig]:
+        """Keep the forwarders that haven't forwarded the message in the meantime."""
+        return [
+            forwarder
+            for forwarder in forwarders
+            if await self.history_manager.get_discord_message_id(
+                forwarder.forwarder_name, tg_message_id
+            )
+            is None
+        ]
+
+    def _is_message_pending(self, channel_id: int, message: Message) -> bool:
+        """Whether a message is being, or about to be, forwarded by the live handler."""
+        return (channel_id, message.id) in self._messages_in_flight or (
+            time.time() - message.date.timestamp() < RECOVERY_GRACE_PERIOD
+        )
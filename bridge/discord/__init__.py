@@ -3,5 +3,6 @@
 try:
     from .core import DiscordHandler
     from .health import DiscordClientHealth
+    from .rate_limiter import ChannelRateLimiter
 except ImportError as ex:
     raise ex
@@ -1,13 +1,15 @@
 """Discord handler."""
 import asyncio
 import sys
-from typing import List, Optional, Sequence
+from typing import Dict, FrozenSet, List, Optional
 
 import discord
+from cachetools import TTLCache
 from discord import Message, MessageReference, TextChannel
 from telethon.types import Message as TelegramMessage
 
 from bridge.config import Config
+from bridge.discord.rate_limiter import ChannelRateLimiter
 from bridge.history import MessageHistoryHandler
 from bridge.logger import Logger
 from bridge.utils import split_message
@@ -16,6 +18,12 @@ from core import SingletonMeta
 config = Config.get_instance()
 logger = Logger.get_logger(config.application.name)
 
+# Discord message references keyed by (discord_channel_id, discord_message_id)
+_ref_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+_REF_NOT_FOUND = object()
+
+_rate_limiter = ChannelRateLimiter()
+
 
 class DiscordHandler(metaclass=SingletonMeta):
     """Discord handler class."""
@@ -75,14 +83,18 @@ class DiscordHandler(metaclass=SingletonMeta):
         try:
             if image_file:
                 discord_file = discord.File(image_file)
-                sent_message = await discord_channel.send(
-                    message_parts[0], file=discord_file, reference=reference
-                )
+                async with _rate_limiter.acquire(discord_channel.id):
+                    sent_message = await discord_channel.send(
+                        message_parts[0], file=discord_file, reference=reference
+                    )
                 sent_messages.append(sent_message)
                 message_parts.pop(0)
 
+            # Send the parts one after the other, so they are posted in order
+            # and a failure doesn't leave a gap in the text
             for part in message_parts:
-                sent_message = await discord_channel.send(part, reference=reference)
+                async with _rate_limiter.acquire(discord_channel.id):
+                    sent_message = await discord_channel.send(part, reference=reference)
                 sent_messages.append(sent_message)
         except discord.Forbidden:
             logger.error(
@@ -119,39 +131,39 @@ class DiscordHandler(metaclass=SingletonMeta):
             logger.debug("No mapping found for TG message %s", reply_to_msg_id)
             return None
 
-        try:
-            messages = []
-            async for message in discord_channel.history(
-                around=discord.Object(
-                    id=discord_message_id
-                ),  # pylint: disable=line-too-long
-                limit=10,
-            ):  # make this configurable
-                messages.append(message)
-
-            discord_message = next(
-                (msg for msg in messages if msg.id == discord_message_id), None
+        cache_key = (discord_channel.id, discord_message_id)
+        cached_reference = _ref_cache.get(cache_key)
+        if cached_reference is not None:
+            logger.debug(
+                "Using cached reference Discord message for TG message %s",
+                reply_to_msg_id,
             )
-            if not discord_message:
-                logger.debug(
-                    "Reference Discord message not found for TG message %s",
-                    reply_to_msg_id,
-                )
-                return None
+            return None if cached_reference is _REF_NOT_FOUND else cached_reference
+
+        try:
+            discord_message = await discord_channel.fetch_message(discord_message_id)
 
-            return MessageReference.from_message(discord_message)
+            reference = MessageReference.from_message(discord_message)
+            _ref_cache[cache_key] = reference
+            return reference
         except discord.NotFound:
+            _ref_cache[cache_key] = _REF_NOT_FOUND
             logger.debug(
                 "Reference Discord message not found for TG message %s", reply_to_msg_id
             )
             return None
 
+    @staticmethod
+    def forget_reference(discord_channel_id: int, discord_message_id: int) -> None:
+        """Drop the cached reference of a deleted Discord message."""
+        _ref_cache.pop((discord_channel_id, discord_message_id), None)
+
     def get_mention_roles(
         self,
         message_forward_hashtags: List[str],
         mention_override_tags: Optional[List[dict]],
-        discord_built_in_roles: List[str],
-        server_roles: Sequence[discord.Role],
+        discord_built_in_roles: FrozenSet[str],
+        role_mentions: Dict[str, str],
     ) -> List[str]:
         """Get the roles to mention."""
         mention_roles = set()
@@ -177,15 +189,15 @@ class DiscordHandler(metaclass=SingletonMeta):
                         ):
                             mention_roles.add("@" + role_name)
                         else:
-                            role = discord.utils.get(server_roles, name=role_name)
-                            if role:
-                                mention_roles.add(role.mention)
+                            role_mention = role_mentions.get(role_name.lower())
+                            if role_mention:
+                                mention_roles.add(role_mention)
 
         return list(mention_roles)
 
     @staticmethod
     def is_builtin_mention_role(
-        role_name: str, discord_built_in_roles: List[str]
+        role_name: str, discord_built_in_roles: FrozenSet[str]
     ) -> bool:
         """Check if a role name is a Discord built-in mention."""
         return role_name.lower() in discord_built_in_roles
@@ -0,0 +1,63 @@
+"""Client-side rate limiter for the messages sent to Discord."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+
+class TokenBucket:  # pylint: disable=too-few-public-methods
+    """A token bucket refilling `rate` tokens every `per` seconds."""
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.fill_rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ChannelRateLimiter:  # pylint: disable=too-few-public-methods
+    """Pace the sends with a token bucket per Discord channel and a global one."""
+
+    def __init__(
+        self,
+        channel_rate: int = 5,
+        channel_per: float = 5.0,
+        global_rate: int = 50,
+        global_per: float = 1.0,
+    ):
+        self.channel_rate = channel_rate
+        self.channel_per = channel_per
+        self._global_bucket = TokenBucket(global_rate, global_per)
+        self._channel_buckets: Dict[int, TokenBucket] = {}
+
+    def _get_channel_bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = TokenBucket(self.channel_rate, self.channel_per)
+            self._channel_buckets[channel_id] = bucket
+        return bucket
+
+    @asynccontextmanager
+    async def acquire(self, channel_id: int) -> AsyncIterator[None]:
+        """Wait for a send slot on the given Discord channel."""
+        await self._get_channel_bucket(channel_id).acquire()
+        await self._global_bucket.acquire()
+        yield
@@ -2,10 +2,12 @@
 
 import asyncio
 import json
+import os
 import time
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import aiofiles
+import aiosqlite
 import Levenshtein
 from telethon import TelegramClient
 from telethon.tl.types import Message
@@ -17,8 +19,51 @@ from bridge.logger import Logger
 config = Config.get_instance()
 logger = Logger.get_logger(config.application.name)
 
+# The database lives in its own directory, next to its WAL and shared memory files
+MESSAGES_HISTORY_DIR = "data"
+MESSAGES_HISTORY_DB = os.path.join(MESSAGES_HISTORY_DIR, "messages_history.db")
+# Legacy JSON mapping file, imported into the database on first use
 MESSAGES_HISTORY_FILE = "messages_history.json"
-MISSED_MESSAGES_HISTORY_FILE = "missed_messages_history.json"
+# Stored in the database user_version once the legacy file has been imported
+LEGACY_IMPORT_VERSION = 1
+
+CREATE_MAPPINGS_TABLE = """
+CREATE TABLE IF NOT EXISTS mappings (
+    forwarder_name TEXT NOT NULL,
+    telegram_id INTEGER NOT NULL,
+    discord_id INTEGER NOT NULL,
+    PRIMARY KEY (forwarder_name, telegram_id)
+)
+"""
+CREATE_MISSED_MESSAGES_TABLE = """
+CREATE TABLE IF NOT EXISTS missed_messages (
+    forwarder_name TEXT NOT NULL,
+    telegram_id INTEGER NOT NULL,
+    discord_channel_id INTEGER NOT NULL,
+    exception TEXT,
+    PRIMARY KEY (forwarder_name, telegram_id)
+)
+"""
+INSERT_MAPPING = (
+    "INSERT OR REPLACE INTO mappings (forwarder_name, telegram_id, discord_id) "
+    "VALUES (?, ?, ?)"
+)
+IMPORT_MAPPING = (
+    "INSERT OR IGNORE INTO mappings (forwarder_name, telegram_id, discord_id) "
+    "VALUES (?, ?, ?)"
+)
+INSERT_MISSED_MESSAGE = (
+    "INSERT OR REPLACE INTO missed_messages "
+    "(forwarder_name, telegram_id, discord_channel_id, exception) "
+    "VALUES (?, ?, ?, ?)"
+)
+SELECT_DISCORD_ID = (
+    "SELECT discord_id FROM mappings WHERE forwarder_name = ? AND telegram_id = ?"
+)
+SELECT_LAST_MESSAGES = (
+    "SELECT forwarder_name, MAX(telegram_id), discord_id "
+    "FROM mappings GROUP BY forwarder_name"
+)
 
 
 class MessageHistoryHandler:
@@ -29,58 +74,136 @@ class MessageHistoryHandler:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._mapping_data_cache = None
+            cls._connection = None
             cls._lock = asyncio.Lock()
         return cls._instance
 
-    async def load_mapping_data(self) -> dict:
-        """Load the mapping data from the mapping file."""
+    async def get_connection(self) -> aiosqlite.Connection:
+        """Get the connection to the history database, creating it on first use."""
         async with self._lock:
-            logger.debug("Loading mapping data...")
-            if self._mapping_data_cache is None:
+            if self._connection is None:
+                logger.debug("Opening the messages history database...")
+                os.makedirs(MESSAGES_HISTORY_DIR, exist_ok=True)
+                connection = await aiosqlite.connect(MESSAGES_HISTORY_DB)
+                await connection.execute("PRAGMA journal_mode=WAL")
+                await connection.execute("PRAGMA synchronous=NORMAL")
+                await connection.execute(CREATE_MAPPINGS_TABLE)
+                await connection.execute(CREATE_MISSED_MESSAGES_TABLE)
+                await connection.commit()
+                await self._import_legacy_mapping_data(connection)
+                self._connection = connection
+
+            return self._connection
+
+    async def close(self) -> None:
+        """Close the connection to the history database, if open."""
+        async with self._lock:
+            if self._connection is not None:
+                logger.debug("Closing the messages history database...")
+                await self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def _legacy_mapping_rows(
+        mapping_data: Any,
+    ) -> Tuple[List[Tuple[str, int, int]], int]:
+        """Collect the valid mappings of the legacy JSON data, counting the skipped entries."""
+        rows = []
+        skipped = 0
+        for forwarder_name, forwarder_data in mapping_data.items():
+            if not isinstance(forwarder_data, dict):
+                skipped += 1
+                continue
+            for tg_message_id, discord_message_id in forwarder_data.items():
+                # Missed messages were stored as [channel_id, exception] pairs
+                if isinstance(discord_message_id, bool) or not isinstance(
+                    discord_message_id, int
+                ):
+                    skipped += 1
+                    continue
                 try:
-                    async with aiofiles.open(
-                        MESSAGES_HISTORY_FILE, "r", encoding="utf-8"
-                    ) as messages_mapping:
-                        data = json.loads(await messages_mapping.read())
-                        logger.debug("Loaded mapping data: %s", data)
-                        self._mapping_data_cache = data
-                except FileNotFoundError:
-                    self._mapping_data_cache = {}
+                    rows.append(
+                        (forwarder_name, int(tg_message_id), discord_message_id)
+                    )
+                except ValueError:
+                    skipped += 1
+        return rows, skipped
+
+    @staticmethod
+    async def _import_legacy_mapping_data(connection: aiosqlite.Connection) -> None:
+        """Import the mappings of the legacy JSON file, unless they were already imported."""
+        if not os.path.isfile(MESSAGES_HISTORY_FILE):
+            return
+
+        async with connection.execute("PRAGMA user_version") as cursor:
+            row = await cursor.fetchone()
+        if row and row[0] >= LEGACY_IMPORT_VERSION:
+            return
 
-            return self._mapping_data_cache
+        try:
+            async with aiofiles.open(
+                MESSAGES_HISTORY_FILE, "r", encoding="utf-8"
+            ) as messages_mapping:
+                mapping_data = json.loads(await messages_mapping.read())
+
+            rows, skipped = MessageHistoryHandler._legacy_mapping_rows(mapping_data)
+
+            await connection.execute("BEGIN")
+            try:
+                # Never override the mappings saved since the database was created
+                await connection.executemany(IMPORT_MAPPING, rows)
+                await connection.execute(
+                    f"PRAGMA user_version = {LEGACY_IMPORT_VERSION}"
+                )
+                await connection.commit()
+            except Exception:
+                await connection.rollback()
+                raise
+
+            logger.info(
+                "Imported %s mappings from %s, skipped %s invalid entries",
+                len(rows),
+                MESSAGES_HISTORY_FILE,
+                skipped,
+            )
+        except (
+            OSError,
+            ValueError,
+            TypeError,
+            AttributeError,
+            OverflowError,
+            aiosqlite.Error,
+        ) as ex:
+            logger.error(
+                "An error occurred while importing mapping data from %s: %s",
+                MESSAGES_HISTORY_FILE,
+                ex,
+                exc_info=config.application.debug,
+            )
 
     async def save_mapping_data(
         self, forwarder_name: str, tg_message_id: int, discord_message_id: int
     ) -> None:
-        """Save the mapping data to the mapping file."""
-        # async with self._lock:
-        mapping_data = await self.load_mapping_data()
-
-        logger.debug(
-            "Saving mapping data: %s, %s, %s",
-            forwarder_name,
-            tg_message_id,
-            discord_message_id,
+        """Save the mapping data to the history database."""
+        await self.save_mappings_data(
+            [(forwarder_name, tg_message_id, discord_message_id)]
         )
 
-        if forwarder_name not in mapping_data:
-            mapping_data[forwarder_name] = {}
+    async def save_mappings_data(
+        self, mappings: Sequence[Tuple[str, int, int]]
+    ) -> None:
+        """Save several (forwarder_name, tg_message_id, discord_message_id) mappings in a single transaction."""
+        if not mappings:
+            return
 
-        mapping_data[forwarder_name][tg_message_id] = discord_message_id
-        try:
-            async with aiofiles.open(
-                MESSAGES_HISTORY_FILE, "w", encoding="utf-8"
-            ) as messages_mapping:
-                await messages_mapping.write(json.dumps(mapping_data, indent=4))
+        logger.debug("Saving mapping data: %s", mappings)
 
-            self._mapping_data_cache = mapping_data
+        try:
+            connection = await self.get_connection()
+            await connection.executemany(INSERT_MAPPING, mappings)
+            await connection.commit()
 
             logger.debug("Mapping data saved successfully.")
-
-            if config.application.debug:
-                logger.debug("Current mapping data: %s", mapping_data)
-
         except Exception as ex:  # pylint: disable=broad-except
             logger.error(
                 "An error occurred while saving mapping data: %s",
@@ -95,9 +218,7 @@ class MessageHistoryHandler:
         discord_channel_id: int,
         exception: Any,
     ) -> None:
-        """Save the missed message to the missed messages file."""
-        mapping_data = await self.load_mapping_data()
-
+        """Save the missed message to the history database."""
         logger.debug(
             "Saving missed message: %s, %s, %s, %s",
             forwarder_name,
@@ -106,21 +227,20 @@ class MessageHistoryHandler:
             exception,
         )
 
-        if forwarder_name not in mapping_data:
-            mapping_data[forwarder_name] = {}
-
-        mapping_data[forwarder_name][tg_message_id] = discord_channel_id, exception
         try:
-            async with aiofiles.open(
-                MISSED_MESSAGES_HISTORY_FILE, "w", encoding="utf-8"
-            ) as missed_messages_mapping:
-                await missed_messages_mapping.write(json.dumps(mapping_data, indent=4))
+            connection = await self.get_connection()
+            await connection.execute(
+                INSERT_MISSED_MESSAGE,
+                (
+                    forwarder_name,
+                    tg_message_id,
+                    discord_channel_id,
+                    str(exception) if exception is not None else None,
+                ),
+            )
+            await connection.commit()
 
             logger.debug("Missed message saved successfully.")
-
-            if config.application.debug:
-                logger.debug("Current missed messages data: %s", mapping_data)
-
         except Exception as ex:  # pylint: disable=broad-except
             logger.error(
                 "An error occurred while saving missed message: %s",
@@ -132,40 +252,52 @@ class MessageHistoryHandler:
         self, forwarder_name: str, tg_message_id: int
     ) -> Optional[int]:
         """Get the Discord message ID associated with the given TG message ID for the specified forwarder."""
-        mapping_data = await self.load_mapping_data()
-        forwarder_data = mapping_data.get(forwarder_name, None)
-
-        if forwarder_data is not None:
-            return forwarder_data.get(tg_message_id, None)
-
-        return None
+        connection = await self.get_connection()
+        async with connection.execute(
+            SELECT_DISCORD_ID, (forwarder_name, tg_message_id)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        return row[0] if row else None
+
+    async def get_discord_message_ids(
+        self, forwarder_name: str, tg_message_ids: List[int]
+    ) -> Dict[int, int]:
+        """Get the Discord message IDs associated with the given TG message IDs for the specified forwarder."""
+        if not tg_message_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in tg_message_ids)
+        connection = await self.get_connection()
+        async with connection.execute(
+            "SELECT telegram_id, discord_id FROM mappings "
+            f"WHERE forwarder_name = ? AND telegram_id IN ({placeholders})",
+            (forwarder_name, *tg_message_ids),
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        return dict(rows)
 
     async def get_last_messages_for_all_forwarders(self) -> List[dict]:
         """Get the last messages for each forwarder."""
-        mapping_data = await self.load_mapping_data()
+        connection = await self.get_connection()
+        async with connection.execute(SELECT_LAST_MESSAGES) as cursor:
+            rows = await cursor.fetchall()
+
         last_messages = []
-        if mapping_data.items():
-            for forwarder_name, forwarder_data in mapping_data.items():
-                if not forwarder_data:
-                    logger.debug(
-                        "No messages found in the history for forwarder %s",
-                        forwarder_name,
-                    )
-                    continue
-                last_tg_message_id = max(forwarder_data, key=int)
-                logger.debug(
-                    "Last TG message ID for forwarder %s: %s",
-                    forwarder_name,
-                    last_tg_message_id,
-                )
-                discord_message_id = forwarder_data[last_tg_message_id]
-                last_messages.append(
-                    {
-                        "forwarder_name": forwarder_name,
-                        "telegram_id": int(last_tg_message_id),
-                        "discord_id": discord_message_id,
-                    }
-                )
+        for forwarder_name, last_tg_message_id, discord_message_id in rows:
+            logger.debug(
+                "Last TG message ID for forwarder %s: %s",
+                forwarder_name,
+                last_tg_message_id,
+            )
+            last_messages.append(
+                {
+                    "forwarder_name": forwarder_name,
+                    "telegram_id": last_tg_message_id,
+                    "discord_id": discord_message_id,
+                }
+            )
         return last_messages
 
     async def fetch_messages_after(
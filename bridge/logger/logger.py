@@ -28,6 +28,10 @@ class Logger(logging.Logger):
         if level is None:
             level = logging.INFO
 
+        # Filter on the logger itself too, so the disabled records
+        # are dropped before any LogRecord gets created.
+        self.setLevel(level)
+
         # Remove all handlers associated with the logger object.
         for logger_handler in self.handlers:
             self.removeHandler(logger_handler)
@@ -1,8 +1,10 @@
 """This module handles the communication with the OpenAI API."""
 import asyncio
 import functools
+import hashlib
 
 import openai
+from cachetools import TTLCache
 
 from bridge.config import Config
 from bridge.logger import Logger
@@ -11,6 +13,15 @@ from core import SingletonMeta
 config = Config.get_instance()
 logger = Logger.get_logger(config.application.name)
 
+SUGGESTION_ERROR = "Error generating suggestion"
+
+# Maximum number of concurrent requests to the OpenAI API
+OPENAI_CONCURRENCY = 4
+
+# Sentiment analysis tasks keyed by the digest of the analyzed text
+_sentiment_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+
 
 class OpenAIHandler(metaclass=SingletonMeta):
     """OpenAI handler class."""
@@ -47,13 +58,13 @@ class OpenAIHandler(metaclass=SingletonMeta):
             return suggestion
         except openai.InvalidRequestError as ex:  # pylint: disable=no-member
             logger.error("Invalid request error: %s", {ex})
-            return "Error generating suggestion: Invalid request."
+            return f"{SUGGESTION_ERROR}: Invalid request."
         except openai.APIError as ex:
             logger.error("API error: %s", {ex})
-            return "Error generating suggestion: API error."
+            return f"{SUGGESTION_ERROR}: API error."
         except Exception as ex:  # pylint: disable=broad-except
             logger.error("Error generating suggestion: %s", {ex})
-            return "Error generating suggestion."
+            return f"{SUGGESTION_ERROR}."
 
     @staticmethod
     async def analyze_message_sentiment(text: str) -> str:
@@ -86,10 +97,33 @@ class OpenAIHandler(metaclass=SingletonMeta):
             return suggestion
         except openai.InvalidRequestError as ex:  # pylint: disable=no-member
             logger.error("Invalid request error: %s", {ex})
-            return "Error generating suggestion: Invalid request."
+            return f"{SUGGESTION_ERROR}: Invalid request."
         except openai.APIError as ex:
             logger.error("API error: %s", {ex})
-            return "Error generating suggestion: API error."
+            return f"{SUGGESTION_ERROR}: API error."
         except Exception as ex:  # pylint: disable=broad-except
             logger.error("Error generating suggestion: %s", {ex})
-            return "Error generating suggestion."
+            return f"{SUGGESTION_ERROR}."
+
+    @staticmethod
+    async def get_message_sentiment(text: str) -> str:
+        """Get the sentiment analysis of the message text, reusing the result
+        of a previous or in-flight analysis of the same text."""
+        key = hashlib.blake2s(text.encode(), digest_size=16).hexdigest()
+
+        task = _sentiment_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(OpenAIHandler._bounded_sentiment(text))
+            _sentiment_cache[key] = task
+
+        suggestion = await asyncio.shield(task)
+        if suggestion.startswith(SUGGESTION_ERROR):
+            _sentiment_cache.pop(key, None)
+
+        return suggestion
+
+    @staticmethod
+    async def _bounded_sentiment(text: str) -> str:
+        """Analyze the message sentiment, bounding the concurrent API requests."""
+        async with _openai_semaphore:
+            return await OpenAIHandler.analyze_message_sentiment(text)
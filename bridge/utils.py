@@ -1,4 +1,5 @@
 """Utility functions."""
+import re
 from typing import List, Tuple
 
 from telethon.tl.types import (
@@ -11,6 +12,8 @@ from telethon.tl.types import (
     MessageEntityTextUrl,
 )
 
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+
 
 def split_message(message: str, max_length: int = 2000) -> List[str]:
     """Split a message into multiple messages if it exceeds the max length."""
@@ -18,18 +21,19 @@ def split_message(message: str, max_length: int = 2000) -> List[str]:
         return [message]
 
     message_parts = []
-    while len(message) > max_length:
+    start = 0
+    while len(message) - start > max_length:
         # Find the last newline before the max length.
-        split_index = message[:max_length].rfind("\n")
-        if split_index == -1:
+        split_index = message.rfind("\n", start, start + max_length)
+        if split_index <= start:
             # If a newline wasn't found, split at the max length.
-            split_index = max_length
+            split_index = start + max_length
 
-        message_parts.append(message[:split_index])
-        message = message[split_index:].lstrip()
+        message_parts.append(message[start:split_index])
+        start = _LEADING_WHITESPACE_RE.match(message, split_index).end()  # type: ignore
 
-    if message:
-        message_parts.append(message)
+    if start < len(message):
+        message_parts.append(message[start:])
 
     return message_parts
 
@@ -19,11 +19,17 @@ from bridge.discord import DiscordHandler
 from bridge.enums import ProcessStateEnum
 from bridge.events import EventDispatcher
 from bridge.healtcheck import HealthHandler
+from bridge.history import MessageHistoryHandler
 from bridge.logger import Logger
 from bridge.release import __version__
 from bridge.telegram import TelegramHandler
 from core import SingletonMeta
 
+try:
+    import uvloop  # pylint: disable=import-error
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 ERR_API_DISABLED = "API mode is disabled, please use the CLI to start the bridge, or enable it in the config file."
 ERR_API_ENABLED = "API mode is enabled, please use the API to start the bridge, or disable it in the config file."
 
@@ -517,9 +523,20 @@ class Forwarder(metaclass=SingletonMeta):
                             "Error cancelling task %s: %s", {running_task}, {ex}
                         )
 
+        await self.close_history()
+
         self.remove_pid_file()
         self.logger.info("Shutdown process completed.")
 
+    async def close_history(self):
+        """Close the messages history database."""
+        try:
+            self.logger.info("Closing the messages history...")
+            await MessageHistoryHandler().close()
+            self.logger.info("Messages history closed.")
+        except Exception as ex:  # pylint: disable=broad-except
+            self.logger.error("Error closing the messages history: %s", ex)
+
     async def shutdown(self, sig):
         """Shutdown the application gracefully."""
         self.logger.warning("Shutdown received signal %s, shutting down...", {sig})
@@ -532,17 +549,21 @@ class Forwarder(metaclass=SingletonMeta):
         for task in tasks:
             task.cancel()
 
-        # Wait for all tasks to be cancelled
-        results = await asyncio.gather(
-            *tasks, return_exceptions=config.application.debug
-        )
+        try:
+            # Wait for all tasks to be cancelled
+            results = await asyncio.gather(
+                *tasks, return_exceptions=config.application.debug
+            )
 
-        # Check for errors
-        for result in results:
-            if isinstance(result, asyncio.CancelledError):
-                continue
-            if isinstance(result, Exception):
-                self.logger.error("Error during shutdown: %s", result)
+            # Check for errors
+            for result in results:
+                if isinstance(result, asyncio.CancelledError):
+                    continue
+                if isinstance(result, Exception):
+                    self.logger.error("Error during shutdown: %s", result)
+        finally:
+            # The history database runs its own thread, which would keep the process alive
+            await self.close_history()
 
         # if not config.api.enabled:
         # Stop the loop
@@ -622,6 +643,10 @@ if __name__ == "__main__":
 
     shoud_start: bool = __start or __stop
 
+    # uvicorn already runs the API on uvloop, do the same for the CLI
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     forwarder = Forwarder(asyncio.new_event_loop(), __background)
 
     forwarder.cli_controller(start_forwarding=shoud_start)